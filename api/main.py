@@ -1,11 +1,23 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from api.responses import static_json
 from api.routers import ingest, metrics, alerts, health
+from api.services.slack_service import open_client, close_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_client()
+    yield
+    await close_client()
+
+app = FastAPI(title="TrustLens API", version="0.1", lifespan=lifespan)
 
-app = FastAPI(title="TrustLens API", version="0.1")
+_welcome = static_json({"message": "Welcome to TrustLens 🚀"})
 
 @app.get("/")
-def root():
-    return {"message": "Welcome to TrustLens 🚀"}
+async def root():
+    return _welcome()
 
 app.include_router(ingest.router, prefix="/ingest", tags=["Ingest"])
 app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
@@ -0,0 +1,11 @@
+import orjson
+from fastapi import Response
+
+def static_json(content):
+    """Encode a constant payload once; the returned callable builds a Response from those bytes."""
+    body = orjson.dumps(content)
+
+    def respond():
+        return Response(body, media_type="application/json")
+
+    return respond
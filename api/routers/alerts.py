@@ -1,33 +1,54 @@
-from fastapi import APIRouter
+import asyncio
+from typing import List
+
+import numpy as np
+from fastapi import APIRouter, Query
 from api.services.slack_service import send_slack_alert
 from api.routers.metrics import run_metrics
 
 router = APIRouter()
 
 @router.post("/trigger")
-def trigger_alert(source: str = "csv", null_threshold: float = 0.2, minutes_threshold: int = 60):
-    result = run_metrics(source)
-    if "error" in result:
-        return result
+async def trigger_alert(source: List[str] = Query(["csv"]), null_threshold: float = 0.2, minutes_threshold: int = 60) -> dict:
+    # Repeated ?source= values would otherwise be computed and reported twice
+    source = list(dict.fromkeys(source))
+    results = await asyncio.gather(*(run_metrics(s) for s in source))
+
+    # A source without data is reported under "errors" but doesn't hide breaches in the others
+    errors = {s: r["error"] for s, r in zip(source, results) if "error" in r}
+    if len(errors) == len(source):
+        return {"error": next(iter(errors.values())), "errors": errors}
+    source = [s for s in source if s not in errors]
+    results = [r for r in results if "error" not in r]
 
-    metrics = result["metrics"]
-    alerts = []
+    # Compare every source against the thresholds in one pass (None becomes NaN, which never breaches)
+    null_rates = np.array([r["metrics"]["null_rate"] for r in results], dtype=float)
+    minutes = np.array([r["metrics"]["minutes_since_last_update"] for r in results], dtype=float)
+    null_breach = null_rates > null_threshold
+    stale_breach = minutes > minutes_threshold
 
-    if metrics["null_rate"] is not None and metrics["null_rate"] > null_threshold:
-        alerts.append(f"High null rate: {metrics['null_rate']*100:.1f}%")
+    by_source = {}
+    for i in np.flatnonzero(null_breach | stale_breach):
+        metrics = results[i]["metrics"]
+        source_alerts = []
+        if null_breach[i]:
+            source_alerts.append(f"High null rate: {metrics['null_rate']*100:.1f}%")
+        if stale_breach[i]:
+            source_alerts.append(f"Data stale: {metrics['minutes_since_last_update']} minutes since last update")
+        by_source[source[i]] = source_alerts
 
-    if metrics["minutes_since_last_update"] is not None and metrics["minutes_since_last_update"] > minutes_threshold:
-        alerts.append(f"Data stale: {metrics['minutes_since_last_update']} minutes since last update")
+    # "alerts" stays a flat list however many sources are passed; by_source says which is which
+    alerts = [a for source_alerts in by_source.values() for a in source_alerts]
 
     if alerts:
-        msg = f"⚠️ TrustLens Alert for {source}:\n" + "\n".join(alerts)
-        send_slack_alert(msg)
-        return {"alerts": alerts, "slack": "sent"}
+        msg = "\n\n".join(f"⚠️ TrustLens Alert for {s}:\n" + "\n".join(a) for s, a in by_source.items())
+        await send_slack_alert(msg)
+        return {"alerts": alerts, "by_source": by_source, "errors": errors, "slack": "sent"}
     else:
-        return {"alerts": [], "status": "all good ✅"}
+        return {"alerts": [], "by_source": {}, "errors": errors, "status": "all good ✅"}
 
 # NEW: Slack test endpoint
 @router.post("/test")
-def test_alert():
-    send_slack_alert("🚨 Test alert from TrustLens API")
+async def test_alert() -> dict:
+    await send_slack_alert("🚨 Test alert from TrustLens API")
     return {"status": "sent", "message": "Test alert pushed to Slack"}
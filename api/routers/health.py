@@ -1,7 +1,10 @@
 from fastapi import APIRouter
+from api.responses import static_json
 
 router = APIRouter()
 
+_healthy = static_json({"status": "ok", "message": "TrustLens API is healthy ✅"})
+
 @router.get("/healthz")
 async def healthcheck():
-    return {"status": "ok", "message": "TrustLens API is healthy ✅"}
+    return _healthy()
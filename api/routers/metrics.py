@@ -1,13 +1,22 @@
 from fastapi import APIRouter
-from api.services.metrics_service import compute_metrics
+from fastapi.concurrency import run_in_threadpool
+from api.services.metrics_service import summarize, metrics_from_summary
 from api.routers.ingest import DATASTORE
 
 router = APIRouter()
 
+# source -> (version, summary); a new upload bumps the version and invalidates the entry
+_METRICS_CACHE = {}
+
 @router.get("/check")
-def run_metrics(source: str = "csv"):
+async def run_metrics(source: str = "csv") -> dict:
     if source not in DATASTORE:
         return {"error": f"No data loaded for source '{source}'"}
-    df = DATASTORE[source]
-    metrics = compute_metrics(df)
+    df, version = DATASTORE[source]
+    cached = _METRICS_CACHE.get(source)
+    if cached is None or cached[0] != version:
+        # pandas work stays off the event loop
+        cached = (version, await run_in_threadpool(summarize, df))
+        _METRICS_CACHE[source] = cached
+    metrics = metrics_from_summary(cached[1])
     return {"source": source, "metrics": metrics}
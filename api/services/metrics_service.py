@@ -1,18 +1,60 @@
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
 
-def compute_metrics(df: pd.DataFrame):
-    metrics = {}
+def _null_count(col: pd.Series) -> int:
+    # Arrow-backed columns carry a cached null count from the validity bitmap
+    if isinstance(col.dtype, pd.ArrowDtype):
+        return pa.array(col.array).null_count
+    return int(col.isna().sum())
+
+def _is_timestamp(dtype) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_timestamp(dtype.pyarrow_dtype)
+    return isinstance(dtype, np.dtype) and dtype.kind == "M"
+
+def _null_rate(df: pd.DataFrame) -> float:
+    if df.size == 0:
+        return float("nan")
+    # All-float NumPy frames: one isnan pass straight over the values buffer
+    if all(isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in df.dtypes):
+        return float(np.isnan(df.to_numpy()).mean())
+    # Mixed or Arrow-backed dtypes: count nulls column by column, without
+    # materializing an object array or an intermediate Series of means
+    nulls = sum(_null_count(col) for _, col in df.items())
+    return nulls / df.size
+
+def summarize(df: pd.DataFrame):
+    """Time-independent part of the metrics, safe to cache per dataset version."""
+    summary = {}
     # Null rate
-    null_rate = df.isnull().mean().mean()
-    metrics["null_rate"] = round(float(null_rate), 3)
+    summary["null_rate"] = round(float(_null_rate(df)), 3)
 
-    # Minutes since last update (if updated_at column exists)
+    # Last update (if updated_at column exists)
     if "updated_at" in df.columns:
-        last_update = pd.to_datetime(df["updated_at"]).max()
-        delta = datetime.utcnow() - last_update.to_pydatetime()
+        col = df["updated_at"]
+        # Only parse when the column is already a timestamp (demo data, Arrow timestamps);
+        # Arrow date32/date64 columns are datetime-like too but max() would return a date
+        if not _is_timestamp(col.dtype):
+            col = pd.to_datetime(col)
+        summary["last_update"] = col.max()
+    else:
+        summary["last_update"] = None
+
+    return summary
+
+def metrics_from_summary(summary):
+    metrics = {"null_rate": summary["null_rate"]}
+
+    # Minutes since last update, computed at read time so it stays current
+    last_update = summary["last_update"]
+    if last_update is not None:
+        delta = pd.Timestamp.now("UTC").tz_localize(None) - last_update
         metrics["minutes_since_last_update"] = int(delta.total_seconds() / 60)
     else:
         metrics["minutes_since_last_update"] = None
 
     return metrics
+
+def compute_metrics(df: pd.DataFrame):
+    return metrics_from_summary(summarize(df))
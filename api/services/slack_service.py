@@ -1,14 +1,36 @@
 import os
-import requests
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
 WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")
 
-def send_slack_alert(message: str):
+# Shared client so keep-alive connections (and the TLS handshake) are reused across alerts.
+# It is opened and closed by the app lifespan so its pool belongs to the serving event loop.
+_client = None
+
+def _new_client():
+    return httpx.AsyncClient(http2=True, timeout=5.0)
+
+async def open_client():
+    global _client
+    _client = _new_client()
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+async def send_slack_alert(message: str):
     if not WEBHOOK_URL:
         print("⚠️ No Slack webhook configured")
         return
     payload = {"text": message}
-    requests.post(WEBHOOK_URL, json=payload)
+    if _client is not None:
+        await _client.post(WEBHOOK_URL, json=payload)
+    else:
+        # Running without the lifespan (e.g. a bare TestClient): use a one-off client
+        async with _new_client() as client:
+            await client.post(WEBHOOK_URL, json=payload)
@@ -0,0 +1,44 @@
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+client = TestClient(app)
+
+def _trigger(**params):
+    response = client.post("/alerts/trigger", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+def test_single_source_keeps_list_shape():
+    client.get("/ingest/demo")
+    result = _trigger(source="demo", null_threshold=0.5, minutes_threshold=10**9)
+    assert result == {"alerts": [], "by_source": {}, "errors": {}, "status": "all good ✅"}
+
+    result = _trigger(source="demo", null_threshold=0.05, minutes_threshold=10**9)
+    assert result["alerts"] == ["High null rate: 11.1%"]
+
+def test_multiple_sources_listed_and_keyed_by_source():
+    client.get("/ingest/demo")
+    client.post("/ingest/csv", files={"file": ("data.csv", b"id,value\n1,\n2,3\n", "text/csv")})
+    result = _trigger(source=["demo", "csv", "csv"], null_threshold=0.2)
+    assert set(result["by_source"]) == {"demo", "csv"}
+    assert result["by_source"]["csv"] == ["High null rate: 25.0%"]
+    assert result["by_source"]["demo"][0].startswith("Data stale")
+    assert result["alerts"] == result["by_source"]["demo"] + result["by_source"]["csv"]
+
+def test_all_clear_batch_keeps_list_shape():
+    client.get("/ingest/demo")
+    result = _trigger(source=["demo", "demo"], null_threshold=0.5, minutes_threshold=10**9)
+    assert result == {"alerts": [], "by_source": {}, "errors": {}, "status": "all good ✅"}
+
+def test_missing_source_returns_error():
+    result = _trigger(source="nope")
+    assert result["error"] == "No data loaded for source 'nope'"
+    assert result["errors"] == {"nope": result["error"]}
+
+def test_missing_source_does_not_hide_other_breaches():
+    client.get("/ingest/demo")
+    result = _trigger(source=["nope", "demo"], null_threshold=0.05, minutes_threshold=10**9)
+    assert result["errors"] == {"nope": "No data loaded for source 'nope'"}
+    assert result["by_source"] == {"demo": ["High null rate: 11.1%"]}
+    assert result["slack"] == "sent"
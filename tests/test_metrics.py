@@ -0,0 +1,55 @@
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+client = TestClient(app)
+
+def _upload(body: bytes):
+    response = client.post("/ingest/csv", files={"file": ("data.csv", body, "text/csv")})
+    assert response.status_code == 200
+    return response.json()
+
+def _check():
+    response = client.get("/metrics/check", params={"source": "csv"})
+    assert response.status_code == 200
+    return response.json()["metrics"]
+
+def test_date_only_updated_at():
+    _upload(b"id,updated_at\n1,2025-09-01\n2,2025-09-08\n")
+    metrics = _check()
+    assert metrics["null_rate"] == 0.0
+    assert metrics["minutes_since_last_update"] > 0
+
+def test_timestamp_updated_at():
+    _upload(b"id,updated_at\n1,2025-09-01 10:00:00\n2,\n")
+    metrics = _check()
+    assert metrics["null_rate"] == 0.25
+    assert metrics["minutes_since_last_update"] > 0
+
+def test_demo_source():
+    client.get("/ingest/demo")
+    response = client.get("/metrics/check", params={"source": "demo"})
+    assert response.json()["metrics"]["null_rate"] == 0.111
+
+def test_null_markers_in_string_columns():
+    _upload(b'id,name\n1,a\n2,\n3,NA\n4,""\n5,None\n6,<NA>\n')
+    assert _check()["null_rate"] == 0.417
+
+def test_pandas_na_markers():
+    _upload(b"x,y\n1,N/A\n2,#N/A\n3,None\n4,n/a\n5,-nan\n")
+    assert _check()["null_rate"] == 0.5
+
+def test_duplicate_headers():
+    result = _upload(b"a,a,b\n1,2,3\n4,,6\n")
+    assert result["columns"] == ["a", "a.1", "b"]
+    assert _check()["null_rate"] == 0.167
+
+def test_short_rows_are_padded_with_nulls():
+    result = _upload(b"a,b,c\n1,2,3\n4,5\n")
+    assert result == {"rows": 2, "columns": ["a", "b", "c"]}
+    assert _check()["null_rate"] == 0.167
+
+def test_empty_headers_are_named_like_pandas():
+    result = _upload(b",x,,\n0,1,2,3\n1,,5,6\n")
+    assert result["columns"] == ["Unnamed: 0", "x", "Unnamed: 2", "Unnamed: 3"]
+    assert _check()["null_rate"] == 0.125
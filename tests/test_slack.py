@@ -0,0 +1,46 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.services import slack_service
+
+@pytest.fixture
+def webhook(monkeypatch):
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(slack_service, "WEBHOOK_URL", f"http://127.0.0.1:{server.server_port}/hook")
+    yield received
+    server.shutdown()
+    server.server_close()
+
+def test_alerts_survive_repeated_lifespans(webhook):
+    for _ in range(2):
+        with TestClient(app) as client:
+            assert client.post("/alerts/test").status_code == 200
+            assert client.post("/alerts/test").status_code == 200
+    assert len(webhook) == 4
+    assert webhook[0] == {"text": "🚨 Test alert from TrustLens API"}
+
+def test_alerts_without_lifespan(webhook):
+    client = TestClient(app)
+    assert client.post("/alerts/test").status_code == 200
+    assert client.post("/alerts/test").status_code == 200
+    assert len(webhook) == 2